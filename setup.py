@@ -9,6 +9,7 @@ setup(
     install_requires=[
         'click',
         'fabric',
+        'orjson',
         'paramiko',
         'requests',
         'tabulate',
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from yurt import config
+from yurt.exceptions import ConfigWriteException
+
+
+class ConfigTest(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.config_dir, "config.json")
+
+        patches = [
+            mock.patch.object(config, "config_dir", self.config_dir),
+            mock.patch.object(config, "_config_file", self.config_file),
+            mock.patch.object(config, "_bootstrapped", False),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        config.invalidate_config_cache()
+        self.addCleanup(config.invalidate_config_cache)
+        self.addCleanup(shutil.rmtree, self.config_dir, ignore_errors=True)
+
+    def read_file(self):
+        with open(self.config_file) as f:
+            return f.read()
+
+    def write_file(self, content):
+        with open(self.config_file, "w") as f:
+            f.write(content)
+
+    def test_bootstrap_creates_empty_config(self):
+        self.assertIsNone(config.get_config(config.Key.vm_name))
+        self.assertEqual(self.read_file(), "{}")
+
+    def test_read_is_cached(self):
+        self.write_file('{"vm_name": "cached"}')
+        self.assertEqual(config.get_config(config.Key.vm_name), "cached")
+
+        self.write_file('{"vm_name": "on-disk"}')
+        self.assertEqual(config.get_config(config.Key.vm_name), "cached")
+
+        config.invalidate_config_cache()
+        self.assertEqual(config.get_config(config.Key.vm_name), "on-disk")
+
+    def test_set_config_refreshes_cache(self):
+        config.set_config(config.Key.vm_name, "yurt-vm")
+        config.set_config(config.Key.ssh_port, 4000)
+
+        self.assertEqual(config.get_config(config.Key.vm_name), "yurt-vm")
+        self.assertEqual(config.get_config(config.Key.ssh_port), 4000)
+
+        config.invalidate_config_cache()
+        self.assertEqual(config.get_config(config.Key.vm_name), "yurt-vm")
+        self.assertEqual(config.get_config(config.Key.ssh_port), 4000)
+
+    def test_clear_refreshes_cache(self):
+        config.set_config(config.Key.vm_name, "yurt-vm")
+        config.clear()
+
+        self.assertIsNone(config.get_config(config.Key.vm_name))
+        self.assertEqual(self.read_file(), "{}")
+
+    def test_failed_write_leaves_cache_and_file(self):
+        config.set_config(config.Key.vm_name, "yurt-vm")
+        content = self.read_file()
+
+        with mock.patch.object(config.os, "replace", side_effect=OSError), \
+                self.assertLogs(level="ERROR"), \
+                self.assertRaises(ConfigWriteException):
+            config.set_config(config.Key.vm_name, "other-vm")
+
+        self.assertEqual(config.get_config(config.Key.vm_name), "yurt-vm")
+        self.assertEqual(self.read_file(), content)
+        self.assertEqual(os.listdir(self.config_dir), ["config.json"])
+
+    @unittest.skipIf(config.system == config.System.windows,
+                     "POSIX file modes only")
+    def test_write_keeps_file_mode(self):
+        config.get_config(config.Key.vm_name)
+        os.chmod(self.config_file, 0o644)
+
+        config.set_config(config.Key.vm_name, "yurt-vm")
+
+        self.assertEqual(os.stat(self.config_file).st_mode & 0o777, 0o644)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+from unittest import mock
+
+from yurt.vm import vbox
+from yurt.exceptions import VBoxException
+
+
+LIST_HOSTONLYIFS = """Name:            VirtualBox Host-Only Ethernet Adapter
+GUID:            786f6276-656e-4074-8000-0a0027000000
+DHCP:            Disabled
+IPAddress:       192.168.56.1
+NetworkMask:     255.255.255.0
+IPV6Address:     fe80::1c6d:9d1e:8d8f:2e9b
+IPV6NetworkMaskPrefixLength: 64
+HardwareAddress: 0a:00:27:00:00:00
+MediumType:      Ethernet
+Wireless:        No
+Status:          Up
+VBoxNetworkName: HostInterfaceNetworking-VirtualBox Host-Only Ethernet Adapter
+
+Name:            VirtualBox Host-Only Ethernet Adapter (2)
+GUID:            786f6276-656e-4074-8000-0a0027000001
+DHCP:            Disabled
+IPAddress:       192.168.57.1
+NetworkMask:     255.255.255.0
+IPV6Address:
+IPV6NetworkMaskPrefixLength: 0
+HardwareAddress: 0a:00:27:00:00:01
+MediumType:      Ethernet
+Wireless:        No
+Status:          Up
+VBoxNetworkName: HostInterfaceNetworking-VirtualBox Host-Only Ethernet Adapter (2)
+
+Name:            vboxnet10
+GUID:            786f6276-656e-4074-8000-0a002700000a
+DHCP:            Disabled
+IPAddress:       192.168.66.1
+NetworkMask:     255.255.255.0
+HardwareAddress: 0a:00:27:00:00:0a
+MediumType:      Ethernet
+Wireless:        No
+Status:          Down
+VBoxNetworkName: HostInterfaceNetworking-vboxnet10"""
+
+LIST_VMS = """"yurt-5b0c7f0e-2f5d-4b4e-9f8a-2a1d1c8f4e11" {4c3f1b9e-8d0a-4f6e-a2b7-9d6c1e0f3a52}
+"my "quoted" vm" {0e9d8c7b-6a5f-4e3d-2c1b-0a9f8e7d6c5b}
+"ubuntu {old}" {b1a2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d}
+"""
+
+SHOWVMINFO = """name="yurt-5b0c7f0e-2f5d-4b4e-9f8a-2a1d1c8f4e11"
+groups="/"
+ostype="Ubuntu (64-bit)"
+UUID="4c3f1b9e-8d0a-4f6e-a2b7-9d6c1e0f3a52"
+CfgFile="C:\\Users\\yurt\\AppData\\Local\\yurt\\vm\\a=b.vbox"
+memory=2048
+cpus=2
+VMState="running"
+VMStateChangeTime="2020-10-01T12:00:00.000000000"
+"SCSI-0-0"="C:\\Users\\yurt\\AppData\\Local\\yurt\\vm\\disk.vmdk"
+Forwarding(0)="ssh,tcp,,4000,,22"
+"""
+
+
+class VBoxOutputParsingTest(unittest.TestCase):
+
+    def patch_output(self, output):
+        patch = mock.patch.object(vbox, "run_vbox", return_value=output)
+        run_vbox = patch.start()
+        self.addCleanup(patch.stop)
+        return run_vbox
+
+    def test_list_host_only_interfaces(self):
+        run_vbox = self.patch_output(LIST_HOSTONLYIFS)
+
+        self.assertEqual(vbox.list_host_only_interfaces(), [
+            "VirtualBox Host-Only Ethernet Adapter",
+            "VirtualBox Host-Only Ethernet Adapter (2)",
+            "vboxnet10",
+        ])
+        run_vbox.assert_called_once_with(["list", "hostonlyifs"])
+
+    def test_get_interface_info(self):
+        self.patch_output(LIST_HOSTONLYIFS)
+
+        info = vbox.get_interface_info("VirtualBox Host-Only Ethernet Adapter")
+
+        self.assertEqual(info["Name"], "VirtualBox Host-Only Ethernet Adapter")
+        self.assertEqual(info["IPAddress"], "192.168.56.1")
+        self.assertEqual(info["NetworkMask"], "255.255.255.0")
+        self.assertEqual(info["IPV6Address"], "fe80::1c6d:9d1e:8d8f:2e9b")
+        self.assertEqual(
+            info["VBoxNetworkName"],
+            "HostInterfaceNetworking-VirtualBox Host-Only Ethernet Adapter")
+
+    def test_get_interface_info_name_with_regex_metacharacters(self):
+        self.patch_output(LIST_HOSTONLYIFS)
+
+        info = vbox.get_interface_info(
+            "VirtualBox Host-Only Ethernet Adapter (2)")
+
+        self.assertEqual(info["IPAddress"], "192.168.57.1")
+        self.assertEqual(info["IPV6Address"], "")
+
+    def test_get_interface_info_last_block_without_blank_line(self):
+        self.patch_output(LIST_HOSTONLYIFS)
+
+        info = vbox.get_interface_info("vboxnet10")
+
+        self.assertEqual(info["IPAddress"], "192.168.66.1")
+        self.assertEqual(info["Status"], "Down")
+        self.assertEqual(
+            info["VBoxNetworkName"], "HostInterfaceNetworking-vboxnet10")
+
+    def test_get_interface_info_not_found(self):
+        self.patch_output(LIST_HOSTONLYIFS)
+
+        for name in ["vboxnet.0", "vboxnet1", "VirtualBox"]:
+            with self.subTest(name=name):
+                with self.assertRaises(VBoxException):
+                    vbox.get_interface_info(name)
+
+    def test_list_vms(self):
+        run_vbox = self.patch_output(LIST_VMS)
+
+        self.assertEqual(vbox.list_vms(), [
+            ("yurt-5b0c7f0e-2f5d-4b4e-9f8a-2a1d1c8f4e11",
+             "4c3f1b9e-8d0a-4f6e-a2b7-9d6c1e0f3a52"),
+            ('my "quoted" vm', "0e9d8c7b-6a5f-4e3d-2c1b-0a9f8e7d6c5b"),
+            ("ubuntu {old}", "b1a2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d"),
+        ])
+        run_vbox.assert_called_once_with(["list", "vms"])
+
+    def test_list_vms_empty(self):
+        self.patch_output("")
+
+        self.assertEqual(vbox.list_vms(), [])
+
+    def test_get_vm_info(self):
+        run_vbox = self.patch_output(SHOWVMINFO)
+
+        info = vbox.get_vm_info("yurt-vm")
+
+        self.assertEqual(info["VMState"], '"running"')
+        self.assertEqual(info["memory"], "2048")
+        self.assertEqual(info["cpus"], "2")
+        self.assertEqual(
+            info["CfgFile"],
+            '"C:\\Users\\yurt\\AppData\\Local\\yurt\\vm\\a=b.vbox"')
+        self.assertEqual(
+            info['"SCSI-0-0"'],
+            '"C:\\Users\\yurt\\AppData\\Local\\yurt\\vm\\disk.vmdk"')
+        self.assertEqual(info["Forwarding(0)"], '"ssh,tcp,,4000,,22"')
+        run_vbox.assert_called_once_with(
+            ["showvminfo", "yurt-vm", "--machinereadable"])
+
+    def test_get_vm_info_skips_lines_without_separator(self):
+        self.patch_output('name="yurt-vm"\n\nunexpected\nVMState="poweroff"\n')
+
+        self.assertEqual(vbox.get_vm_info("yurt-vm"), {
+            "name": '"yurt-vm"',
+            "VMState": '"poweroff"',
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,11 @@ import logging
 import os
 from enum import Enum
 import platform
+import stat
 import sys
+import tempfile
+
+import orjson
 
 from yurt.exceptions import ConfigReadException, ConfigWriteException
 
@@ -86,7 +90,19 @@ ssh_private_key_file = os.path.join(provision_dir, "id_rsa")
 
 
 # Utilities ###############################################################
-def _ensure_config_file_exists():
+_config_cache = None
+_bootstrapped = False
+
+
+def _bootstrap():
+    """
+    Create the config directory and an empty config file, once per process.
+    """
+    global _bootstrapped
+
+    if _bootstrapped:
+        return
+
     if not os.path.isdir(config_dir):
         os.makedirs(config_dir)
 
@@ -94,36 +110,75 @@ def _ensure_config_file_exists():
         with open(_config_file, 'w') as f:
             f.write('{}')
 
+    _bootstrapped = True
+
 
 def _read_config():
-    import json
+    global _config_cache
+
+    if _config_cache is not None:
+        return _config_cache
 
     try:
-        _ensure_config_file_exists()
-        with open(_config_file, 'r') as f:
-            return json.load(f)
+        _bootstrap()
+        with open(_config_file, 'rb') as f:
+            _config_cache = orjson.loads(f.read())
+            return _config_cache
     except FileNotFoundError:
         msg = 'Config file not found'
         logging.error(msg)
         raise ConfigReadException(msg)
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         msg = f"Malformed config file: {_config_file}"
         logging.error(msg)
         raise ConfigReadException(msg)
 
 
 def _write_config(config):
-    import json
+    global _config_cache
 
     try:
-        _ensure_config_file_exists()
-        with open(_config_file, 'w') as f:
-            json.dump(config, f)
+        _bootstrap()
+        payload = orjson.dumps(config)
+
+        # Write to a temporary file and swap it in so that a failed write
+        # never leaves a truncated config file behind. The swap targets the
+        # resolved path so a symlinked config file stays a symlink.
+        target = os.path.realpath(_config_file)
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(target), suffix=".json")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # mkstemp creates the file as 0600; keep the existing mode.
+            try:
+                os.chmod(tmp_file, stat.S_IMODE(os.stat(target).st_mode))
+            except FileNotFoundError:
+                pass
+
+            os.replace(tmp_file, target)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
+        _config_cache = config
     except Exception as e:
         logging.error(f"Error writing config: {e}")
         raise ConfigWriteException(e)
 
 
+def invalidate_config_cache():
+    """
+    Drop the cached config so the next read goes back to the config file.
+    """
+    global _config_cache
+
+    _config_cache = None
+
+
 def get_config(key: Key):
     config = _read_config()
     if config:
@@ -139,11 +194,7 @@ def set_config(key: Key, value: str):
     new = old.copy()
     new[key.name] = value
 
-    try:
-        _write_config(new)
-    except ConfigWriteException:
-        _write_config(old)
-        raise ConfigWriteException
+    _write_config(new)
 
 
 def clear():
@@ -2,9 +2,11 @@ import logging
 from typing import List
 import os
 
+import orjson
+
 from yurt import config
 from yurt.exceptions import LXCException, CommandException
-from yurt.util import retry, find
+from yurt.util import retry
 from .util import *  # pylint: disable=unused-wildcard-import
 
 
@@ -35,13 +37,14 @@ def destroy():
 
 
 def list_():
-    import json
-
     def get_info(instance):
         try:
             addresses = instance["state"]["network"]["eth0"]["addresses"]
-            ipv4_info = find(lambda a: a["family"] == "inet", addresses, {})
-            ipv4_address = ipv4_info.get("address", "")
+            ipv4_address = next(
+                (a.get("address", "")
+                 for a in addresses if a["family"] == "inet"),
+                ""
+            )
         except KeyError as e:
             logging.debug(f"Key Error: {e}")
             ipv4_address = ""
@@ -62,8 +65,7 @@ def list_():
         }
     try:
         output = run_lxc(["list", "--format", "json"], show_spinner=True)
-        instances = json.loads(output)
-        return list(map(get_info, instances))
+        return [get_info(instance) for instance in orjson.loads(output)]
     except CommandException as e:
         raise LXCException(f"Failed to list networks: {e.message}")
 
@@ -127,7 +129,7 @@ def list_remote_images(remote: str):
         output = run_lxc(["image", "list", f"{remote}:",
                           "--format", "json"], show_spinner=True)
 
-        images = filter_remote_images(json.loads(output))
+        images = filter_remote_images(orjson.loads(output))
 
         images_info = filter(
             None,
@@ -149,7 +151,7 @@ def list_cached_images():
                           "--format", "json"], show_spinner=True)
 
         images_info = filter(
-            None, map(get_cached_image_info, json.loads(output)))
+            None, map(get_cached_image_info, orjson.loads(output)))
         return list(images_info)
     except CommandException as e:
         raise LXCException(f"Could not fetch images - {e.message}")
@@ -1,8 +1,9 @@
-import json
 import logging
 import os
 from typing import List, Dict
 
+import orjson
+
 from yurt import config
 from yurt.exceptions import LXCException, RemoteCommandException
 from yurt.util import run, run_in_vm, find
@@ -40,17 +41,17 @@ def is_initialized():
 
 def is_remote_configured():
     result = run_lxc(["remote", "list", "--format", "json"])
-    remotes = json.loads(result)
+    remotes = orjson.loads(result)
     return bool(remotes.get("yurt"))
 
 
 def is_network_configured():
-    networks = json.loads(run_lxc(["network", "list", "--format", "json"]))
+    networks = orjson.loads(run_lxc(["network", "list", "--format", "json"]))
     return NETWORK_NAME in list(map(lambda n: n["name"], networks))
 
 
 def is_profile_configured():
-    profiles = json.loads(run_lxc(["profile", "list", "--format", "json"]))
+    profiles = orjson.loads(run_lxc(["profile", "list", "--format", "json"]))
     return PROFILE_NAME in list(map(lambda p: p["name"], profiles))
 
 
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 from typing import List
@@ -6,22 +7,31 @@ from yurt import config
 from yurt.exceptions import (CommandException, RemoteCommandException,
                              CommandTimeout, YurtException)
 
+# Runs a command and its spinner side by side. Shared so that threads are
+# only started once per process.
+_spinner_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="yurt-spinner")
+
 
 def download_file(url: str, destination: str, show_progress=False):
-    import shutil
     import requests
     from click import progressbar
 
+    chunk_size = 1 << 20  # 1 MiB
+
     try:
         with requests.get(url, stream=True) as r:
-            with open(destination, 'wb') as f:
+            r.raise_for_status()
+            with open(destination, 'wb', buffering=chunk_size) as f:
                 total_bytes = r.headers.get("content-length")
+                chunks = r.iter_content(chunk_size=chunk_size)
 
                 if total_bytes is None or not show_progress:
-                    shutil.copyfileobj(r.raw, f)
+                    for chunk in chunks:
+                        f.write(chunk)
                 else:
                     with progressbar(length=int(total_bytes)) as bar:
-                        for chunk in r.iter_content(chunk_size=4096):
+                        for chunk in chunks:
                             f.write(chunk)
                             bar.update(len(chunk))
     except (
@@ -67,43 +77,36 @@ def retry(fn, retries=3, wait_time=5):
 
 
 def find(fn, iterable, default):
-    return next(filter(lambda i: fn(i), iterable), default)
+    return next(filter(fn, iterable), default)
+
+
+_SPINNER_FRAMES = ("⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷")
 
 
 def _spinner():
-    frames = [
-        "⣾",
-        "⣽",
-        "⣻",
-        "⢿",
-        "⡿",
-        "⣟",
-        "⣯",
-        "⣷"
-    ]
-
-    frame = 0
-    while True:
-        if frame >= len(frames):
-            frame = 0
+    from itertools import cycle
+    import shutil
 
-        yield frames[frame]
-        frame += 1
+    # Pad the frames to the terminal width once, rather than on every render.
+    columns, _ = shutil.get_terminal_size()
+    width = columns - 5
+    lines = tuple(
+        f"\r{frame}{' ' * (width - len(frame))}]" for frame in _SPINNER_FRAMES)
+
+    return cycle(lines)
 
 
 def _render_spinner(spinner, clear=False):
     import sys
     import shutil
 
-    columns, _ = shutil.get_terminal_size()
-
-    width = columns - 5
     if clear:
-        print(f"\r{' ' * width}\r", end="", file=sys.stderr)
+        columns, _ = shutil.get_terminal_size()
+        width = columns - 5
+        sys.stderr.write(f"\r{' ' * width}\r")
     elif spinner:
-        frame = next(spinner)
-        print(f"\r{frame}{' ' * (width - len(frame))}]",
-              end="", file=sys.stderr)
+        sys.stderr.write(next(spinner))
+    sys.stderr.flush()
 
 
 def _async_spinner(worker_future):
@@ -126,10 +129,12 @@ def sleep_for(timeout: float, show_spinner=False):
         _render_spinner(None, clear=True)
         frame_step = 0.1
         spinner = _spinner()
-        while timeout > 0:
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while remaining > 0:
             _render_spinner(spinner)
-            time.sleep(frame_step)
-            timeout -= frame_step
+            time.sleep(min(frame_step, remaining))
+            remaining = deadline - time.monotonic()
         _render_spinner(None, clear=True)
     else:
         time.sleep(timeout)
@@ -140,9 +145,10 @@ def _run(cmd, stdin=None, capture_output=True, timeout=None, env=None):
 
     logging.debug(f"Running: {cmd}")
 
-    new_env = dict(os.environ)
+    # Inherit the parent environment as is unless there are overrides.
+    new_env = None
     if env:
-        new_env.update(env)
+        new_env = {**os.environ, **env}
 
     try:
         res = subprocess.run(cmd, capture_output=capture_output,
@@ -167,21 +173,27 @@ def _run(cmd, stdin=None, capture_output=True, timeout=None, env=None):
         logging.error("Operation Aborted")
 
 
-def _get_ssh_connection(port=None):
+def _get_ssh_connection(port=None, connect_timeout=None):
     from fabric import Connection
 
     if not port:
         port = config.get_config(config.Key.ssh_port)
 
+    connect_kwargs = {"key_filename": config.ssh_private_key_file}
+    if connect_timeout:
+        connect_kwargs["banner_timeout"] = connect_timeout
+
     return Connection(
         "localhost",
         user=config.ssh_user_name, port=port,
-        connect_kwargs={"key_filename": config.ssh_private_key_file}
-
+        connect_timeout=connect_timeout,
+        connect_kwargs=connect_kwargs
     )
 
 
-def _run_in_vm(cmd, port=None, hide_output=False, stdin=None):
+def _run_in_vm(cmd, port=None, hide_output=False, stdin=None,
+               connect_timeout=None):
+    import socket
     from paramiko import ssh_exception
     from invoke.exceptions import UnexpectedExit, Failure, ThreadException
     from io import StringIO
@@ -190,7 +202,7 @@ def _run_in_vm(cmd, port=None, hide_output=False, stdin=None):
     if stdin:
         in_stream = StringIO(initial_value=stdin)
 
-    connection = _get_ssh_connection(port)
+    connection = _get_ssh_connection(port, connect_timeout=connect_timeout)
     try:
         result = connection.run(cmd, hide=hide_output, in_stream=in_stream)
         return (result.stdout, result.stderr)
@@ -199,6 +211,9 @@ def _run_in_vm(cmd, port=None, hide_output=False, stdin=None):
     except ssh_exception.SSHException as e:
         logging.debug(e)
         raise RemoteCommandException("SSH connection failed")
+    except socket.timeout as e:
+        logging.debug(e)
+        raise RemoteCommandException("SSH connection timed out")
     except UnexpectedExit as e:
         logging.debug(e)
         raise RemoteCommandException("Command exited with nonzero exit code")
@@ -214,15 +229,39 @@ def _run_in_vm(cmd, port=None, hide_output=False, stdin=None):
 
 
 def is_ssh_available(port):
+    import socket
+
     logging.debug(f"Checking if SSH is available on port: {port}.")
 
+    # Skip the SSH handshake if nothing is listening on the port.
+    try:
+        with socket.create_connection(("localhost", port), timeout=1):
+            pass
+    except OSError as e:
+        logging.debug(e)
+        return False
+
     try:
-        _run_in_vm("hostname", hide_output=True, port=port)
+        _run_in_vm("hostname", hide_output=True, port=port,
+                   connect_timeout=5)
         return True
     except RemoteCommandException:
         return False
 
 
+def _run_with_spinner(fn, *args, **kwargs):
+    # Must not be nested: fn must not itself call run/run_in_vm with
+    # show_spinner=True. Both workers would be busy and the inner call
+    # would wait forever.
+    cmd_future = _spinner_executor.submit(fn, *args, **kwargs)
+    spinner_future = _spinner_executor.submit(_async_spinner, cmd_future)
+    try:
+        return cmd_future.result()
+    finally:
+        # Let the spinner clear its line before anything else is printed.
+        spinner_future.result()
+
+
 def run(cmd: List[str], show_spinner: bool = False, **kwargs):
     """
     Run a command.
@@ -237,13 +276,7 @@ def run(cmd: List[str], show_spinner: bool = False, **kwargs):
         Cancel command if it runs for more than this.
     """
     if show_spinner:
-        from concurrent.futures import ThreadPoolExecutor
-
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            cmd_future = executor.submit(_run, cmd, **kwargs)
-            executor.submit(_async_spinner, cmd_future)
-            return cmd_future.result()
-
+        return _run_with_spinner(_run, cmd, **kwargs)
     else:
         return _run(cmd, **kwargs)
 
@@ -253,15 +286,8 @@ def run_in_vm(cmd: str, show_spinner: bool = False, stdin=None):
     Run a command in the VM over SSH.
     """
     if show_spinner:
-        from concurrent.futures import ThreadPoolExecutor
-
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            cmd_future = executor.submit(
-                _run_in_vm, cmd, hide_output=show_spinner,
-                stdin=stdin
-            )
-            executor.submit(_async_spinner, cmd_future)
-            return cmd_future.result()
+        return _run_with_spinner(
+            _run_in_vm, cmd, hide_output=show_spinner, stdin=stdin)
     else:
         return _run_in_vm(cmd, stdin=stdin)
 
@@ -3,9 +3,21 @@ import logging
 import re
 from typing import Dict, List
 
+from yurt import config
 from yurt.util import is_ssh_available, run, CommandException
 from yurt.exceptions import VBoxException
 
+_VM_LINE_RE = re.compile(r'^"(.*)" \{([^}]*)\}$', re.MULTILINE)
+_HOSTONLY_NAME_RE = re.compile(r"Name: +(.*)")
+
+# One match per interface in 'list hostonlyifs': the name, then the rest of
+# its block up to the blank line separating interfaces.
+_HOSTONLY_INTERFACE_RE = re.compile(
+    r"^Name: +(.*?)$(.*?)(?=\n\n|\Z)", re.MULTILINE | re.DOTALL)
+
+# Resolved on first use by get_vboxmanage_executable.
+_vboxmanage_executable = None
+
 
 def import_vm(vm_name: str, appliance_file: str, base_folder, memory):
     settings_file = os.path.join(base_folder, "{}.vbox".format(vm_name))
@@ -23,29 +35,26 @@ def import_vm(vm_name: str, appliance_file: str, base_folder, memory):
 
 
 def modify_vm(vm_name: str, settings: Dict[str, str]):
-    options = []
-    for k, v in settings.items():
-        options.append(f"--{k}")
-        options.append(v)
+    options = [arg for k, v in settings.items() for arg in (f"--{k}", v)]
 
-    cmd = ["modifyvm", vm_name] + options
-    run_vbox(cmd)
+    run_vbox(["modifyvm", vm_name, *options])
 
 
 def list_vms():
-    def parse_line(line):
-        match = re.search(r'"(.*)" \{(.*)\}', line)
-        return match.groups()
-
     output = run_vbox(["list",  "vms"])
-    return list(map(parse_line, output.splitlines()))
+    return [match.groups() for match in _VM_LINE_RE.finditer(output)]
 
 
 def get_vm_info(vm_name: str):
     cmd = ["showvminfo", vm_name, "--machinereadable"]
     output = run_vbox(cmd)
-    info_list = map(lambda l: l.split("=", 1), output.splitlines())
-    return dict(info_list)
+
+    vm_info: Dict[str, str] = {}
+    for line in output.splitlines():
+        key, separator, value = line.partition("=")
+        if separator:
+            vm_info[key] = value
+    return vm_info
 
 
 def attach_serial_console(vm_name: str, console_file_path: str):
@@ -68,53 +77,49 @@ def stop_vm(vm_name: str, force=False):
 
 
 def list_host_only_interfaces():
-    def get_iface_name(line):
-        match = re.search(r"^Name: +(.*)", line)
-        if match:
-            return match.group(1)
-
-    interfaces = map(
-        get_iface_name,
-        run_vbox(["list", "hostonlyifs"]).splitlines()
-    )
-    return list(filter(None, interfaces))
+    output = run_vbox(["list", "hostonlyifs"])
+    return [
+        match.group(1) for line in output.splitlines()
+        if (match := _HOSTONLY_NAME_RE.match(line))
+    ]
 
 
 def get_interface_info(interface_name: str):
-    lines = run_vbox(["list", "hostonlyifs"]).splitlines()
+    output = run_vbox(["list", "hostonlyifs"])
 
-    interface_info: Dict[str, str] = {}
-    processing_interface_values = False
-    for line in lines:
-        match = re.search(r"^Name: +{}$".format(interface_name), line)
-        if match:
-            processing_interface_values = True
+    for match in _HOSTONLY_INTERFACE_RE.finditer(output):
+        name, body = match.groups()
+        if name != interface_name:
+            continue
 
-        try:
-            if processing_interface_values:
-                if len(line) == 0:
-                    return interface_info
-                key, value = line.split(":", 1)
-                key, value = key.strip(), value.strip()
-                interface_info[key] = value
-
-        except ValueError as e:
-            logging.error(
-                "Error processing line {0}: {1}".format(line, e))
-            raise VBoxException(
-                "Unexpected result from 'list hostonlyifs'")
+        interface_info: Dict[str, str] = {"Name": name}
+        for line in body.splitlines():
+            if not line:
+                continue
+
+            key, separator, value = line.partition(":")
+            if not separator:
+                logging.error(
+                    "Error processing line {0}: missing ':'".format(line))
+                raise VBoxException(
+                    "Unexpected result from 'list hostonlyifs'")
+            interface_info[key.strip()] = value.strip()
+
+        return interface_info
 
     raise VBoxException(
         "Interface {} not found".format(interface_name))
 
 
 def create_hostonly_interface():
-    old_interfaces = set(list_host_only_interfaces())
+    old_interfaces = frozenset(list_host_only_interfaces())
     run_vbox(["hostonlyif", "create"])
-    new_interfaces = set(list_host_only_interfaces())
     try:
-        return new_interfaces.difference(old_interfaces).pop()
-    except KeyError:
+        return next(
+            name for name in list_host_only_interfaces()
+            if name not in old_interfaces
+        )
+    except StopIteration:
         logging.error("Host-Only interface not properly initialized")
 
 
@@ -190,17 +195,25 @@ def get_vboxmanage_executable_windows():
         path = os.path.join(base_dir, "VBoxManage.exe")
         if os.path.exists(path):
             return path
-        else:
-            raise VBoxException("VBoxManage executable not found")
+
+    raise VBoxException("VBoxManage executable not found")
 
 
 def get_vboxmanage_executable():
-    from yurt import config
+    global _vboxmanage_executable
 
-    if config.system == config.System.windows:
-        return get_vboxmanage_executable_windows()
-    else:
-        raise VBoxException(f"Platform {config.system} not supported")
+    if _vboxmanage_executable is None:
+        if config.system == config.System.windows:
+            _vboxmanage_executable = get_vboxmanage_executable_windows()
+        else:
+            import shutil
+
+            # VBoxManage is on the PATH on macOS and Linux.
+            _vboxmanage_executable = shutil.which("VBoxManage")
+            if _vboxmanage_executable is None:
+                raise VBoxException("VBoxManage executable not found")
+
+    return _vboxmanage_executable
 
 
 def run_vbox(args: List[str], **kwargs):